@@ -5,31 +5,50 @@ Creates the Excel template for the roadmap data input.
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 
+# Header styling, shared by every sheet so the stylesheet holds one copy
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill("solid", fgColor="1A1A4E")
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+TITLE_FONT = Font(bold=True, size=14)
+
+
+def _header_row(ws, headers):
+    """Build a styled header row for a write-only sheet."""
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cells.append(cell)
+    return cells
+
+
+def _set_widths(ws, widths):
+    """Apply (column letter, width) pairs to a sheet in one sweep.
+
+    Write-only sheets emit their column widths with the first row, so this
+    must run before anything is appended.
+    """
+    for letter, width in widths:
+        ws.column_dimensions[letter].width = width
+
+
 def create_template():
-    wb = Workbook()
+    wb = Workbook(write_only=True)
     
     # ========== Settings Sheet ==========
-    settings = wb.active
-    settings.title = "Settings"
-    
-    # Header styling
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill("solid", fgColor="1A1A4E")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    settings = wb.create_sheet("Settings")
+    _set_widths(settings, [("A", 20), ("B", 50)])
     
-    settings["A1"] = "Setting"
-    settings["B1"] = "Value"
-    settings["A1"].font = header_font
-    settings["B1"].font = header_font
-    settings["A1"].fill = header_fill
-    settings["B1"].fill = header_fill
+    settings.append(_header_row(settings, ["Setting", "Value"]))
     
     settings_data = [
         ("Title", "Dummy data Infrastructure Capstone Roadmap"),
@@ -44,22 +63,14 @@ def create_template():
         ("Far Term Color", "E8D8C8"),
     ]
     
-    for i, (setting, value) in enumerate(settings_data, start=2):
-        settings[f"A{i}"] = setting
-        settings[f"B{i}"] = value
-    
-    settings.column_dimensions["A"].width = 20
-    settings.column_dimensions["B"].width = 50
+    for row in settings_data:
+        settings.append(row)
     
     # ========== Timeline Sheet ==========
     timeline = wb.create_sheet("Timeline")
+    _set_widths(timeline, [("A", 15), ("B", 15), ("C", 15)])
     
-    timeline["A1"] = "Year"
-    timeline["B1"] = "Width (inches)"
-    timeline["C1"] = "Is Last Column"
-    for col in ["A", "B", "C"]:
-        timeline[f"{col}1"].font = header_font
-        timeline[f"{col}1"].fill = header_fill
+    timeline.append(_header_row(timeline, ["Year", "Width (inches)", "Is Last Column"]))
     
     years_data = [
         ("2023", 0.8, "No"),
@@ -71,44 +82,29 @@ def create_template():
         ("2029-2053", 1.8, "Yes"),
     ]
     
-    for i, (year, width, is_last) in enumerate(years_data, start=2):
-        timeline[f"A{i}"] = year
-        timeline[f"B{i}"] = width
-        timeline[f"C{i}"] = is_last
-    
-    timeline.column_dimensions["A"].width = 15
-    timeline.column_dimensions["B"].width = 15
-    timeline.column_dimensions["C"].width = 15
+    for row in years_data:
+        timeline.append(row)
     
     # ========== Goals Sheet ==========
     goals = wb.create_sheet("Goals")
+    _set_widths(goals, [("A", 10), ("B", 30)])
     
-    goals["A1"] = "Goal ID"
-    goals["B1"] = "Goal Name"
-    for col in ["A", "B"]:
-        goals[f"{col}1"].font = header_font
-        goals[f"{col}1"].fill = header_fill
+    goals.append(_header_row(goals, ["Goal ID", "Goal Name"]))
     
     goals_data = [
         (1, "Overarching goal 1"),
         (2, "Overarching goal 2"),
     ]
     
-    for i, (goal_id, name) in enumerate(goals_data, start=2):
-        goals[f"A{i}"] = goal_id
-        goals[f"B{i}"] = name
-    
-    goals.column_dimensions["A"].width = 10
-    goals.column_dimensions["B"].width = 30
+    for row in goals_data:
+        goals.append(row)
     
     # ========== Rows Sheet ==========
     rows = wb.create_sheet("Rows")
+    _set_widths(rows, [(get_column_letter(col_idx), 18) for col_idx in range(1, 7)])
     
     row_headers = ["Row ID", "STC Label", "FTA Label", "Background Color", "Goal ID", "Row Height (inches)"]
-    for col_idx, header in enumerate(row_headers, start=1):
-        cell = rows.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
+    rows.append(_header_row(rows, row_headers))
     
     # Row data: (row_id, stc, fta, bg_color, goal_id, height)
     rows_data = [
@@ -120,21 +116,15 @@ def create_template():
         (6, "STC4", "FTA6", "Yellow", 2, 0.6),
     ]
     
-    for i, row_data in enumerate(rows_data, start=2):
-        for col_idx, value in enumerate(row_data, start=1):
-            rows.cell(row=i, column=col_idx, value=value)
-    
-    for col_idx in range(1, 7):
-        rows.column_dimensions[get_column_letter(col_idx)].width = 18
+    for row_data in rows_data:
+        rows.append(row_data)
     
     # ========== Milestones Sheet ==========
     milestones = wb.create_sheet("Milestones")
+    _set_widths(milestones, [("A", 10), ("B", 12), ("C", 15), ("D", 25), ("E", 12)])
     
     milestone_headers = ["Row ID", "Year", "Vertical Offset", "Text", "Is Critical"]
-    for col_idx, header in enumerate(milestone_headers, start=1):
-        cell = milestones.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
+    milestones.append(_header_row(milestones, milestone_headers))
     
     # Milestones: (row_id, year, v_offset, text, is_critical)
     milestones_data = [
@@ -170,24 +160,14 @@ def create_template():
         (6, 2027, 0.42, "Critical Goal Text", "Yes"),
     ]
     
-    for i, ms_data in enumerate(milestones_data, start=2):
-        for col_idx, value in enumerate(ms_data, start=1):
-            milestones.cell(row=i, column=col_idx, value=value)
-    
-    milestones.column_dimensions["A"].width = 10
-    milestones.column_dimensions["B"].width = 12
-    milestones.column_dimensions["C"].width = 15
-    milestones.column_dimensions["D"].width = 25
-    milestones.column_dimensions["E"].width = 12
+    for ms_data in milestones_data:
+        milestones.append(ms_data)
     
     # ========== Use Cases Sheet ==========
     usecases = wb.create_sheet("UseCases")
+    _set_widths(usecases, [("A", 20), ("B", 40), ("C", 12)])
     
-    uc_headers = ["Use Case ID", "Description", "Color"]
-    for col_idx, header in enumerate(uc_headers, start=1):
-        cell = usecases.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
+    usecases.append(_header_row(usecases, ["Use Case ID", "Description", "Color"]))
     
     uc_data = [
         ("UC1, UC2, UC3, UC4", "All use cases", "F0C040"),
@@ -195,19 +175,16 @@ def create_template():
         ("UC2, UC4", "Use case 2 text, Use case 4 text", "F0D080"),
     ]
     
-    for i, data in enumerate(uc_data, start=2):
-        for col_idx, value in enumerate(data, start=1):
-            usecases.cell(row=i, column=col_idx, value=value)
-    
-    usecases.column_dimensions["A"].width = 20
-    usecases.column_dimensions["B"].width = 40
-    usecases.column_dimensions["C"].width = 12
+    for data in uc_data:
+        usecases.append(data)
     
     # ========== Instructions Sheet ==========
     instructions = wb.create_sheet("Instructions")
+    _set_widths(instructions, [("A", 80)])
     
-    instructions["A1"] = "ROADMAP DATA INPUT INSTRUCTIONS"
-    instructions["A1"].font = Font(bold=True, size=14)
+    title_cell = WriteOnlyCell(instructions, value="ROADMAP DATA INPUT INSTRUCTIONS")
+    title_cell.font = TITLE_FONT
+    instructions.append([title_cell])
     
     inst_text = [
         "",
@@ -252,13 +229,11 @@ def create_template():
         "   python create_roadmap_from_excel.py roadmap_data.xlsx",
     ]
     
-    for i, text in enumerate(inst_text, start=2):
-        instructions[f"A{i}"] = text
-    
-    instructions.column_dimensions["A"].width = 80
+    for text in inst_text:
+        instructions.append([text])
     
     # Move Instructions to first position
-    wb.move_sheet(instructions, offset=-5)
+    wb.move_sheet("Instructions", offset=-5)
     
     return wb
 
@@ -7,21 +7,87 @@ Usage:
 
 Example:
     python create_roadmap_from_excel.py roadmap_data.xlsx my_roadmap.pptx
+
+Requirements:
+    pip install openpyxl python-pptx
 """
 
+import hashlib
+import io
+import os
+import pickle
+import re
 import sys
-import pandas as pd
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from pathlib import Path
+from xml.sax.saxutils import escape
+from openpyxl import load_workbook
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN
 
+# Parsed Excel data is cached under cache_dir(), keyed by a hash of the
+# workbook contents. Bump CACHE_FORMAT whenever the shape of the loaded data
+# changes.
+CACHE_FORMAT = '1'
+CACHE_MAX_ENTRIES = 32
+
+# EMU per inch; layout math is done in integer EMU
+INCH = 914400
+
 # Slide dimensions (standard 16:9)
 SLIDE_WIDTH = Inches(13.333)
 SLIDE_HEIGHT = Inches(7.5)
 
+# Text box insets
+TEXT_MARGIN_X = Pt(2)
+TEXT_MARGIN_Y = Pt(1)
+
+# Paragraph text handling, as python-pptx's paragraph text setter does it:
+# line feeds and vertical tabs become line breaks, and the remaining control
+# characters (other than tab) are written as _xHHHH_ escapes.
+LINE_BREAK_RE = re.compile(r'[\n\v]')
+CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0B-\x1F]')
+
+# Shape position and size, filled in with str.format
+XFRM_TEMPLATE = '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+
+# Vertical year gridlines
+GRIDLINE_WIDTH = Pt(1)
+GRIDLINE_COLOR = RGBColor(0xcc, 0xcc, 0xcc)
 
+# Milestone offsets from the start of their year column
+MILESTONE_YEAR_OFFSET = int(0.15 * INCH)
+MILESTONE_FAR_OFFSET = int(0.3 * INCH)
+
+# Column accessors used to unpack sheet records in the drawing loops
+TIMELINE_FIELDS = itemgetter('Year', 'Width (inches)')
+GOAL_FIELDS = itemgetter('Goal ID', 'Goal Name')
+ROW_FIELDS = itemgetter('Row ID', 'STC Label', 'FTA Label', 'Background Color',
+                        'Row Height (inches)')
+MILESTONE_FIELDS = itemgetter('Year', 'Vertical Offset', 'Text', 'Is Critical')
+USECASE_FIELDS = itemgetter('Use Case ID', 'Color')
+
+# Default style and empty text body python-pptx gives every autoshape
+AUTOSHAPE_STYLE_XML = (
+    '<p:style>'
+    '<a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef>'
+    '</p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+)
+
+
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
     """Convert hex color string to RGBColor."""
     hex_color = hex_color.lstrip('#')
@@ -32,108 +98,271 @@ def hex_to_rgb(hex_color):
     )
 
 
-def add_text_box(slide, left, top, width, height, text, font_size=10, bold=False, 
+def _fill_xml(color):
+    """Return a solid fill for an RGBColor, or no fill for None."""
+    if color is None:
+        return '<a:noFill/>'
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def _xfrm_xml(left, top, width, height):
+    """Return the position and size of a shape in EMU."""
+    return XFRM_TEMPLATE.format(x=int(left), y=int(top), cx=int(width), cy=int(height))
+
+
+def _autoshape_xml(name, prst, xfrm, fill_color, line_color):
+    """Return the <p:sp> XML for a preset autoshape placed by xfrm.
+
+    The shape id is a placeholder; add_shapes() numbers the shapes when they
+    are attached to the slide.
+    """
+    return ('<p:sp>'
+            f'<p:nvSpPr><p:cNvPr id="0" name="{name}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{xfrm}'
+            f'<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>'
+            f'{_fill_xml(fill_color)}<a:ln>{_fill_xml(line_color)}</a:ln></p:spPr>'
+            f'{AUTOSHAPE_STYLE_XML}</p:sp>')
+
+
+def _rect_xml(left, top, width, height, fill_color=None, line_color=None):
+    """Return the XML for a rectangle."""
+    return _autoshape_xml('Rectangle', 'rect', _xfrm_xml(left, top, width, height),
+                          fill_color, line_color)
+
+
+@lru_cache(maxsize=None)
+def _triangle_template(size, color):
+    """Return the triangle XML for one size and color with x and y as format fields.
+
+    Milestone markers only come in a handful of colors, so each variant's
+    markup is built once and reused for every marker.
+    """
+    xfrm = (f'<a:xfrm><a:off x="{{x}}" y="{{y}}"/>'
+            f'<a:ext cx="{size}" cy="{size}"/></a:xfrm>')
+    return _autoshape_xml('Isosceles Triangle', 'triangle', xfrm, color, None)
+
+
+def _tri_xml(left, top, size, color):
+    """Return the XML for an isosceles triangle with no outline."""
+    return _triangle_template(int(size), color).format(x=int(left), y=int(top))
+
+
+@lru_cache(maxsize=None)
+def _gridline_template():
+    """Return the gridline XML with x, y and cy left as str.format fields.
+
+    Every gridline has the same width and color, so the markup is built once.
+    """
+    xfrm = (f'<a:xfrm><a:off x="{{x}}" y="{{y}}"/>'
+            f'<a:ext cx="{GRIDLINE_WIDTH}" cy="{{cy}}"/></a:xfrm>')
+    return _autoshape_xml('Rectangle', 'rect', xfrm, GRIDLINE_COLOR, None)
+
+
+@lru_cache(maxsize=None)
+def _textbox_template(font_size, bold, italic, font_color, fill_color, alignment):
+    """Return the text box XML for one text style.
+
+    Position, size and text are left as str.format fields (x, y, cx, cy,
+    runs), so each style's markup is built only once.
+    """
+    color_xml = _fill_xml(font_color) if font_color else ''
+    return ('<p:sp>'
+            f'<p:nvSpPr><p:cNvPr id="0" name="TextBox"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{XFRM_TEMPLATE}'
+            f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>{_fill_xml(fill_color)}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="square" lIns="{TEXT_MARGIN_X}" rIns="{TEXT_MARGIN_X}" '
+            f'tIns="{TEXT_MARGIN_Y}" bIns="{TEXT_MARGIN_Y}"/><a:lstStyle/>'
+            f'<a:p><a:pPr algn="{PP_ALIGN.to_xml(alignment)}">'
+            f'<a:defRPr sz="{int(font_size * 100)}" b="{int(bold)}" i="{int(italic)}">'
+            f'{color_xml}</a:defRPr></a:pPr>{{runs}}</a:p></p:txBody></p:sp>')
+
+
+def _escape_ctrl_chars(text):
+    """Replace control characters that XML cannot hold with _xHHHH_ escapes."""
+    return CONTROL_CHAR_RE.sub(lambda m: f'_x{ord(m.group()):04X}_', text)
+
+
+def _textbox_xml(left, top, width, height, text, font_size, bold, italic,
+                 font_color, fill_color, alignment):
+    """Return the XML for a word-wrapped text box holding one paragraph."""
+    lines = LINE_BREAK_RE.split(str(text))
+    runs = '<a:br/>'.join(f'<a:r><a:t>{escape(_escape_ctrl_chars(line))}</a:t></a:r>'
+                          if line else '' for line in lines)
+    template = _textbox_template(font_size, bold, italic, font_color, fill_color, alignment)
+    return template.format(x=int(left), y=int(top), cx=int(width), cy=int(height), runs=runs)
+
+
+def add_text_box(shapes, left, top, width, height, text, font_size=10, bold=False, 
                  font_color=None, fill_color=None, alignment=PP_ALIGN.LEFT, italic=False):
-    """Add a text box to the slide."""
-    shape = slide.shapes.add_textbox(left, top, width, height)
-    tf = shape.text_frame
-    tf.word_wrap = True
-    tf.auto_size = None
-    tf.margin_left = Pt(2)
-    tf.margin_right = Pt(2)
-    tf.margin_top = Pt(1)
-    tf.margin_bottom = Pt(1)
-    
-    p = tf.paragraphs[0]
-    p.text = str(text)
-    p.font.size = Pt(font_size)
-    p.font.bold = bold
-    p.font.italic = italic
-    p.alignment = alignment
-    
-    if font_color:
-        p.font.color.rgb = font_color
-    
-    if fill_color:
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = fill_color
-    
-    return shape
-
-
-def add_rectangle(slide, left, top, width, height, fill_color=None, line_color=None):
+    """Add a text box to the pending slide shapes."""
+    shapes.append(_textbox_xml(left, top, width, height, text, font_size, bold, italic,
+                               font_color, fill_color, alignment))
+
+
+def add_rectangle(shapes, left, top, width, height, fill_color=None, line_color=None):
     """Add a rectangle shape."""
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-    
-    if fill_color:
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = fill_color
-    else:
-        shape.fill.background()
-    
-    if line_color:
-        shape.line.color.rgb = line_color
-    else:
-        shape.line.fill.background()
-    
-    return shape
+    shapes.append(_rect_xml(left, top, width, height, fill_color, line_color))
 
 
-def add_triangle_milestone(slide, left, top, size=Inches(0.12), color=None):
+def add_triangle_milestone(shapes, left, top, size=Inches(0.12), color=None):
     """Add a triangle milestone marker."""
-    shape = slide.shapes.add_shape(MSO_SHAPE.ISOSCELES_TRIANGLE, left, top, size, size)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = color
-    shape.line.fill.background()
-    return shape
+    shapes.append(_tri_xml(left, top, size, color))
 
 
-def load_excel_data(excel_path):
-    """Load all data from the Excel file."""
+def add_gridline(shapes, left, top, height):
+    """Add a vertical year gridline."""
+    shapes.append(_gridline_template().format(x=int(left), y=int(top), cy=int(height)))
+
+
+def add_shapes(slide, shapes):
+    """Parse the pending shape XML in one pass and append it to the slide.
+
+    The fragments carry no namespace declarations of their own; they are
+    joined under a single spTree root that declares them.
+    """
+    tree = parse_xml(f'<p:spTree {nsdecls("p", "a")}>{"".join(shapes)}</p:spTree>')
+    elements = list(tree)
+    for shape_id, sp in enumerate(elements, start=slide.shapes._next_shape_id):
+        c_nv_pr = sp.nvSpPr.cNvPr
+        c_nv_pr.set('id', str(shape_id))
+        c_nv_pr.set('name', f"{c_nv_pr.get('name')} {shape_id - 1}")
+    slide.shapes._spTree.extend(elements)
+
+
+def plan_milestones(row_milestones, row_top, year_x, year_to_idx):
+    """Compute milestone positions for one row.
+    
+    year_x holds the left edge of each year column and year_to_idx maps a
+    year to its column. Returns a list of (x, y, text, is_critical) tuples
+    in EMU; milestones whose year falls before the timeline are dropped.
+    """
+    planned = []
+    for year, v_offset, text, is_critical in map(MILESTONE_FIELDS, row_milestones):
+        year = str(int(year))
+        
+        # Find x position
+        idx = year_to_idx.get(year)
+        if idx is not None:
+            x = year_x[idx] + MILESTONE_YEAR_OFFSET
+        elif int(year) >= 2029:
+            x = year_x[year_to_idx.get('2029', -1)] + MILESTONE_FAR_OFFSET
+        else:
+            continue
+        
+        y = row_top + int(v_offset * INCH)
+        planned.append((x, y, text, str(is_critical).lower() == 'yes'))
+    return planned
+
+
+def read_sheet(wb, sheet_name):
+    """Read a worksheet into a list of dicts keyed by its header row."""
+    rows_iter = wb[sheet_name].iter_rows(values_only=True)
+    headers = next(rows_iter, None)
+    if headers is None:
+        return []
+    return [dict(zip(headers, r)) for r in rows_iter
+            if any(value is not None for value in r)]
+
+
+def parse_excel_data(excel_path):
+    """Parse all data from the Excel file."""
     data = {}
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
     
-    # Load Settings
-    settings_df = pd.read_excel(excel_path, sheet_name="Settings")
-    data['settings'] = dict(zip(settings_df['Setting'], settings_df['Value']))
-    
-    # Load Timeline
-    data['timeline'] = pd.read_excel(excel_path, sheet_name="Timeline")
-    
-    # Load Goals
-    data['goals'] = pd.read_excel(excel_path, sheet_name="Goals")
-    
-    # Load Rows
-    data['rows'] = pd.read_excel(excel_path, sheet_name="Rows")
-    
-    # Load Milestones
-    data['milestones'] = pd.read_excel(excel_path, sheet_name="Milestones")
-    
-    # Load Use Cases
-    data['usecases'] = pd.read_excel(excel_path, sheet_name="UseCases")
+    try:
+        # Load Settings
+        settings = read_sheet(wb, "Settings")
+        data['settings'] = {s['Setting']: s['Value'] for s in settings}
+        
+        # Load Timeline
+        data['timeline'] = read_sheet(wb, "Timeline")
+        
+        # Load Goals
+        data['goals'] = read_sheet(wb, "Goals")
+        
+        # Load Rows
+        data['rows'] = read_sheet(wb, "Rows")
+        
+        # Load Milestones
+        data['milestones'] = read_sheet(wb, "Milestones")
+        
+        # Load Use Cases
+        data['usecases'] = read_sheet(wb, "UseCases")
+    finally:
+        wb.close()
     
     return data
 
 
+def cache_dir():
+    """Return the parsed-data cache directory.
+
+    An unset or empty XDG_CACHE_HOME means the default ~/.cache, as the XDG
+    spec says. Raises RuntimeError if there is no home directory to fall
+    back to.
+    """
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'roadmap'
+
+
+def _store_cached_data(cache_path, data):
+    """Write parsed data to the cache and evict the least recently used entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+        
+        entries = sorted(cache_path.parent.glob('*.pkl'), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-CACHE_MAX_ENTRIES]:
+            stale.unlink()
+    except OSError:
+        pass  # The cache is only an optimization
+
+
+def load_excel_data(excel_path):
+    """Load all data from the Excel file, reusing a cached parse if unchanged."""
+    digest = hashlib.sha256(CACHE_FORMAT.encode())
+    with open(excel_path, 'rb') as f:
+        digest.update(f.read())
+    try:
+        cache_path = cache_dir() / f"{digest.hexdigest()}.pkl"
+    except RuntimeError:
+        return parse_excel_data(excel_path)  # No home directory to cache in
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            data = pickle.load(f)
+        os.utime(cache_path)  # Mark as recently used
+        return data
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    
+    data = parse_excel_data(excel_path)
+    _store_cached_data(cache_path, data)
+    return data
+
+
 def create_roadmap_from_data(data):
     """Create the roadmap presentation from loaded data."""
     settings = data['settings']
-    timeline_df = data['timeline']
-    goals_df = data['goals']
-    rows_df = data['rows']
-    milestones_df = data['milestones']
-    usecases_df = data['usecases']
+    timeline = data['timeline']
+    goals = data['goals']
+    rows = data['rows']
+    milestones = data['milestones']
+    usecases = data['usecases']
     
     # Parse colors from settings
     colors = {
-        'navy': hex_to_rgb(settings.get('Navy Color', '1A1A4E')),
-        'pink': hex_to_rgb(settings.get('Pink Background', 'FFE0E0')),
-        'purple': hex_to_rgb(settings.get('Purple Background', 'E0D8F0')),
-        'yellow': hex_to_rgb(settings.get('Yellow Background', 'FFF0D0')),
-        'milestone': hex_to_rgb(settings.get('Milestone Color', 'F0C040')),
-        'critical': hex_to_rgb(settings.get('Critical Text Color', 'CC0000')),
-        'near_term': hex_to_rgb(settings.get('Near Term Color', '555555')),
-        'mid_term': hex_to_rgb(settings.get('Mid Term Color', 'C8A080')),
-        'far_term': hex_to_rgb(settings.get('Far Term Color', 'E8D8C8')),
+        'navy': hex_to_rgb(str(settings.get('Navy Color', '1A1A4E'))),
+        'pink': hex_to_rgb(str(settings.get('Pink Background', 'FFE0E0'))),
+        'purple': hex_to_rgb(str(settings.get('Purple Background', 'E0D8F0'))),
+        'yellow': hex_to_rgb(str(settings.get('Yellow Background', 'FFF0D0'))),
+        'milestone': hex_to_rgb(str(settings.get('Milestone Color', 'F0C040'))),
+        'critical': hex_to_rgb(str(settings.get('Critical Text Color', 'CC0000'))),
+        'near_term': hex_to_rgb(str(settings.get('Near Term Color', '555555'))),
+        'mid_term': hex_to_rgb(str(settings.get('Mid Term Color', 'C8A080'))),
+        'far_term': hex_to_rgb(str(settings.get('Far Term Color', 'E8D8C8'))),
         'tan_box': hex_to_rgb('C0A080'),
     }
     
@@ -151,231 +380,230 @@ def create_roadmap_from_data(data):
     blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
+    # Shapes are collected as XML and attached to the slide at the end
+    shapes = []
+    
     # Background
-    background = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, SLIDE_WIDTH, SLIDE_HEIGHT)
-    background.fill.solid()
-    background.fill.fore_color.rgb = RGBColor(0xe0, 0xe0, 0xd0)
-    background.line.fill.background()
+    add_rectangle(shapes, 0, 0, SLIDE_WIDTH, SLIDE_HEIGHT, RGBColor(0xe0, 0xe0, 0xd0))
     
     # Title
     title = settings.get('Title', 'Roadmap')
-    add_text_box(slide, Inches(0), Inches(0.15), SLIDE_WIDTH, Inches(0.5),
+    add_text_box(shapes, 0, int(0.15 * INCH), SLIDE_WIDTH, int(0.5 * INCH),
                  title, font_size=24, bold=True, italic=True, alignment=PP_ALIGN.CENTER)
     
     # Timeline header
-    header_top = Inches(0.6)
-    header_height = Inches(0.3)
-    left_margin = Inches(1.4)
+    header_top = int(0.6 * INCH)
+    header_height = int(0.3 * INCH)
+    left_margin = int(1.4 * INCH)
+    label_width = INCH
     
     # Add "Fiscal Years" label
-    add_rectangle(slide, left_margin, header_top, Inches(1.0), header_height, colors['navy'])
-    add_text_box(slide, left_margin, header_top, Inches(1.0), header_height,
+    add_rectangle(shapes, left_margin, header_top, label_width, header_height, colors['navy'])
+    add_text_box(shapes, left_margin, header_top, label_width, header_height,
                  "Fiscal Years →", font_size=9, bold=True, font_color=RGBColor(255,255,255),
                  alignment=PP_ALIGN.CENTER)
     
     # Build year columns and track positions
-    x_pos = left_margin + Inches(1.0)
-    year_positions = {}
-    
-    for _, row in timeline_df.iterrows():
-        year = str(row['Year'])
-        width = Inches(row['Width (inches)'])
-        
-        add_rectangle(slide, x_pos, header_top, width, header_height, colors['navy'])
-        add_text_box(slide, x_pos, header_top, width, header_height,
+    year_labels = [str(year) for year, _ in map(TIMELINE_FIELDS, timeline)]
+    year_widths = [int(width_in * INCH) for _, width_in in map(TIMELINE_FIELDS, timeline)]
+    year_x_positions = list(accumulate(year_widths, initial=left_margin + label_width))
+    year_x = year_x_positions[:-1]
+    year_to_idx = {}
+    
+    for idx, (year, x_pos, width) in enumerate(zip(year_labels, year_x, year_widths)):
+        add_rectangle(shapes, x_pos, header_top, width, header_height, colors['navy'])
+        add_text_box(shapes, x_pos, header_top, width, header_height,
                      year, font_size=9, bold=True, font_color=RGBColor(255,255,255),
                      alignment=PP_ALIGN.CENTER)
         
         # Store position for milestone placement
         year_key = year.split("-")[0]  # Use first year for ranges
-        year_positions[year_key] = x_pos
-        
-        x_pos += width
-    
-    total_grid_width = x_pos - left_margin - Inches(1.0)
-    
-    # Layout constants
-    stc_width = Inches(0.4)
-    fta_width = Inches(1.0)
+        year_to_idx[year_key] = idx
+    
+    grid_width = year_x_positions[-1] - left_margin
+    
+    # Layout constants (EMU)
+    stc_width = int(0.4 * INCH)
+    fta_width = INCH
+    label_height = int(0.25 * INCH)
+    label_nudge = int(0.1 * INCH)
+    stc_label_left = int(0.02 * INCH)
+    stc_label_width = stc_width - int(0.04 * INCH)
+    fta_label_left = stc_width + int(0.25 * INCH)
+    fta_label_width = int(0.5 * INCH)
+    tri_size = int(0.12 * INCH)
+    ms_text_offset = int(0.14 * INCH)
+    ms_text_width = int(0.9 * INCH)
+    ms_text_height = int(0.15 * INCH)
+    
+    # Index rows by goal and milestones by row
+    rows_by_goal = defaultdict(list)
+    for row in rows:
+        rows_by_goal[row['Goal ID']].append(row)
+    
+    milestones_by_row = defaultdict(list)
+    for ms in milestones:
+        milestones_by_row[ms['Row ID']].append(ms)
     
     # Process goals and rows
-    current_top = Inches(0.95)
+    current_top = int(0.95 * INCH)
     
-    for _, goal in goals_df.iterrows():
-        goal_id = goal['Goal ID']
-        goal_name = goal['Goal Name']
+    for goal_id, goal_name in map(GOAL_FIELDS, goals):
         
         # Add goal header
-        add_text_box(slide, Inches(0), current_top, SLIDE_WIDTH, Inches(0.25),
+        add_text_box(shapes, 0, current_top, SLIDE_WIDTH, label_height,
                      goal_name, font_size=12, bold=True, italic=True, alignment=PP_ALIGN.CENTER)
-        current_top += Inches(0.3)
+        current_top += int(0.3 * INCH)
         
         # Get rows for this goal
-        goal_rows = rows_df[rows_df['Goal ID'] == goal_id].copy()
-        
-        # Track STC spans
-        stc_spans = {}
-        for _, row in goal_rows.iterrows():
-            stc = row['STC Label']
-            if stc not in stc_spans:
-                stc_spans[stc] = {'start': current_top, 'count': 0}
-            stc_spans[stc]['count'] += 1
+        goal_rows = rows_by_goal.get(goal_id, [])
         
-        # Track current STC for drawing
+        # Track current STC and the height of the rows it spans
         current_stc = None
         stc_start_top = current_top
-        stc_row_count = 0
+        stc_height = 0
         
-        for idx, (_, row) in enumerate(goal_rows.iterrows()):
-            row_id = row['Row ID']
-            stc = row['STC Label']
-            fta = row['FTA Label']
-            bg_color_name = str(row['Background Color']).lower()
-            row_height = Inches(row['Row Height (inches)'])
+        for row_id, stc, fta, bg_color_name, row_height_in in map(ROW_FIELDS, goal_rows):
+            bg_color_name = str(bg_color_name).lower()
+            row_height = int(row_height_in * INCH)
             
             bg_color = bg_color_map.get(bg_color_name, colors['pink'])
             
             # Handle STC column
             if stc != current_stc:
                 # Draw previous STC column if exists
-                if current_stc is not None and stc_row_count > 0:
-                    stc_height = row_height * stc_row_count
-                    add_rectangle(slide, 0, stc_start_top, stc_width, stc_height, colors['navy'])
-                    add_text_box(slide, Inches(0.02), stc_start_top + stc_height/2 - Inches(0.1),
-                                 stc_width - Inches(0.04), Inches(0.25),
+                if current_stc is not None and stc_height > 0:
+                    add_rectangle(shapes, 0, stc_start_top, stc_width, stc_height, colors['navy'])
+                    add_text_box(shapes, stc_label_left, stc_start_top + stc_height // 2 - label_nudge,
+                                 stc_label_width, label_height,
                                  current_stc, font_size=9, bold=True, 
                                  font_color=RGBColor(255,255,255), alignment=PP_ALIGN.CENTER)
                 
                 current_stc = stc
                 stc_start_top = current_top
-                stc_row_count = 1
+                stc_height = row_height
             else:
-                stc_row_count += 1
+                stc_height += row_height
             
             # Draw FTA column
-            add_rectangle(slide, stc_width, current_top, fta_width, row_height, colors['navy'])
-            add_text_box(slide, stc_width + Inches(0.25), current_top + row_height/2 - Inches(0.1),
-                         Inches(0.5), Inches(0.25), fta, font_size=11, bold=True,
+            add_rectangle(shapes, stc_width, current_top, fta_width, row_height, colors['navy'])
+            add_text_box(shapes, fta_label_left, current_top + row_height // 2 - label_nudge,
+                         fta_label_width, label_height, fta, font_size=11, bold=True,
                          font_color=RGBColor(255,255,255), alignment=PP_ALIGN.CENTER)
             
             # Draw grid background
-            add_rectangle(slide, left_margin, current_top, total_grid_width + Inches(1.0), 
-                          row_height, bg_color)
+            add_rectangle(shapes, left_margin, current_top, grid_width, row_height, bg_color)
             
             # Draw dashed vertical lines
-            for year_key, year_x in year_positions.items():
-                line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, year_x, current_top, 
-                                               Pt(1), row_height)
-                line.fill.solid()
-                line.fill.fore_color.rgb = RGBColor(0xcc, 0xcc, 0xcc)
-                line.line.fill.background()
+            for x_pos in year_x:
+                add_gridline(shapes, x_pos, current_top, row_height)
             
             # Add milestones for this row
-            row_milestones = milestones_df[milestones_df['Row ID'] == row_id]
+            row_milestones = milestones_by_row.get(row_id, [])
             
-            for _, ms in row_milestones.iterrows():
-                year = str(int(ms['Year']))
-                v_offset = ms['Vertical Offset']
-                text = ms['Text']
-                is_critical = str(ms['Is Critical']).lower() == 'yes'
-                
-                # Find x position
-                if year in year_positions:
-                    x = year_positions[year] + Inches(0.15)
-                elif int(year) >= 2029:
-                    x = year_positions.get('2029', list(year_positions.values())[-1]) + Inches(0.3)
-                else:
-                    continue
-                
-                y = current_top + Inches(v_offset)
-                
+            for x, y, text, is_critical in plan_milestones(row_milestones, current_top,
+                                                           year_x, year_to_idx):
                 # Add triangle
-                add_triangle_milestone(slide, x, y, Inches(0.12), colors['milestone'])
+                add_triangle_milestone(shapes, x, y, tri_size, colors['milestone'])
                 
                 # Add text
                 text_color = colors['critical'] if is_critical else RGBColor(0x33, 0x33, 0x33)
-                add_text_box(slide, x + Inches(0.14), y, Inches(0.9), Inches(0.15),
+                add_text_box(shapes, x + ms_text_offset, y, ms_text_width, ms_text_height,
                             text, font_size=7, font_color=text_color)
             
             current_top += row_height
         
         # Draw final STC column for this goal
-        if current_stc is not None and stc_row_count > 0:
-            stc_height = Inches(rows_df[rows_df['Goal ID'] == goal_id]['Row Height (inches)'].iloc[0]) * stc_row_count
-            add_rectangle(slide, 0, stc_start_top, stc_width, stc_height, colors['navy'])
-            add_text_box(slide, Inches(0.02), stc_start_top + stc_height/2 - Inches(0.1),
-                         stc_width - Inches(0.04), Inches(0.25),
+        if current_stc is not None and stc_height > 0:
+            add_rectangle(shapes, 0, stc_start_top, stc_width, stc_height, colors['navy'])
+            add_text_box(shapes, stc_label_left, stc_start_top + stc_height // 2 - label_nudge,
+                         stc_label_width, label_height,
                          current_stc, font_size=9, bold=True,
                          font_color=RGBColor(255,255,255), alignment=PP_ALIGN.CENTER)
     
     # Term Arrows
-    arrow_top = current_top + Inches(0.1)
-    arrow_height = Inches(0.35)
+    arrow_top = current_top + int(0.1 * INCH)
+    arrow_height = int(0.35 * INCH)
     
-    add_rectangle(slide, left_margin, arrow_top, Inches(2.4), arrow_height, colors['near_term'])
-    add_text_box(slide, left_margin, arrow_top, Inches(2.4), arrow_height,
+    add_rectangle(shapes, left_margin, arrow_top, int(2.4 * INCH), arrow_height, colors['near_term'])
+    add_text_box(shapes, left_margin, arrow_top, int(2.4 * INCH), arrow_height,
                  "Near Term", font_size=11, bold=True, italic=True,
                  font_color=RGBColor(255,255,255), alignment=PP_ALIGN.CENTER)
     
-    add_rectangle(slide, left_margin + Inches(2.3), arrow_top, Inches(2.0), arrow_height, colors['mid_term'])
-    add_text_box(slide, left_margin + Inches(2.3), arrow_top, Inches(2.0), arrow_height,
+    add_rectangle(shapes, left_margin + int(2.3 * INCH), arrow_top, int(2.0 * INCH), arrow_height, colors['mid_term'])
+    add_text_box(shapes, left_margin + int(2.3 * INCH), arrow_top, int(2.0 * INCH), arrow_height,
                  "Mid Term", font_size=11, bold=True, italic=True,
                  font_color=RGBColor(255,255,255), alignment=PP_ALIGN.CENTER)
     
-    add_rectangle(slide, left_margin + Inches(4.2), arrow_top, Inches(3.4), arrow_height, colors['far_term'])
-    add_text_box(slide, left_margin + Inches(4.2), arrow_top, Inches(3.4), arrow_height,
+    add_rectangle(shapes, left_margin + int(4.2 * INCH), arrow_top, int(3.4 * INCH), arrow_height, colors['far_term'])
+    add_text_box(shapes, left_margin + int(4.2 * INCH), arrow_top, int(3.4 * INCH), arrow_height,
                  "Far Term", font_size=11, bold=True, italic=True,
                  font_color=RGBColor(0x33,0x33,0x33), alignment=PP_ALIGN.CENTER)
     
     # Legend
-    legend_top = arrow_top + Inches(0.5)
-    legend_left = Inches(0.3)
+    legend_top = arrow_top + int(0.5 * INCH)
+    legend_left = int(0.3 * INCH)
     
-    add_text_box(slide, legend_left, legend_top, Inches(1), Inches(0.2),
+    add_text_box(shapes, legend_left, legend_top, INCH, int(0.2 * INCH),
                  "LEGEND", font_size=8, bold=True, italic=True)
     
     # Strategic Test Capability box
-    add_rectangle(slide, legend_left, legend_top + Inches(0.2), Inches(1.3), Inches(0.2), colors['tan_box'])
-    add_text_box(slide, legend_left, legend_top + Inches(0.2), Inches(1.3), Inches(0.2),
+    add_rectangle(shapes, legend_left, legend_top + int(0.2 * INCH), int(1.3 * INCH), int(0.2 * INCH), colors['tan_box'])
+    add_text_box(shapes, legend_left, legend_top + int(0.2 * INCH), int(1.3 * INCH), int(0.2 * INCH),
                  "Strategic Test Capability", font_size=7, font_color=RGBColor(255,255,255),
                  alignment=PP_ALIGN.CENTER)
     
     # Functional Test Area box
-    add_rectangle(slide, legend_left, legend_top + Inches(0.45), Inches(1.3), Inches(0.2), colors['navy'])
-    add_text_box(slide, legend_left, legend_top + Inches(0.45), Inches(1.3), Inches(0.2),
+    add_rectangle(shapes, legend_left, legend_top + int(0.45 * INCH), int(1.3 * INCH), int(0.2 * INCH), colors['navy'])
+    add_text_box(shapes, legend_left, legend_top + int(0.45 * INCH), int(1.3 * INCH), int(0.2 * INCH),
                  "Functional Test Area", font_size=7, font_color=RGBColor(255,255,255),
                  alignment=PP_ALIGN.CENTER)
     
     # Key Milestone
-    add_triangle_milestone(slide, legend_left, legend_top + Inches(0.7), Inches(0.12), colors['milestone'])
-    add_text_box(slide, legend_left + Inches(0.15), legend_top + Inches(0.7), Inches(1), Inches(0.15),
+    add_triangle_milestone(shapes, legend_left, legend_top + int(0.7 * INCH), int(0.12 * INCH), colors['milestone'])
+    add_text_box(shapes, legend_left + int(0.15 * INCH), legend_top + int(0.7 * INCH), INCH, int(0.15 * INCH),
                  "Key Milestone", font_size=7)
     
     # Use Cases
-    uc_left = legend_left + Inches(1.6)
-    add_text_box(slide, uc_left, legend_top + Inches(0.2), Inches(1.5), Inches(0.15),
+    uc_left = legend_left + int(1.6 * INCH)
+    add_text_box(shapes, uc_left, legend_top + int(0.2 * INCH), int(1.5 * INCH), int(0.15 * INCH),
                  "Use Cases:", font_size=7, bold=True)
     
     uc_texts = ["UC1 – Use case 1 text", "UC2 – Use case 2 text", 
                 "UC3 – Use case 3 text", "UC4 – Use case 4 text"]
     for i, uc_text in enumerate(uc_texts):
-        add_text_box(slide, uc_left, legend_top + Inches(0.35 + i * 0.15), Inches(1.5), Inches(0.15),
+        add_text_box(shapes, uc_left, legend_top + int((0.35 + i * 0.15) * INCH), int(1.5 * INCH), int(0.15 * INCH),
                      uc_text, font_size=7)
     
     # UC color indicators from Excel
-    uc_indicator_left = uc_left + Inches(1.7)
-    for i, (_, uc) in enumerate(usecases_df.iterrows()):
-        uc_id = uc['Use Case ID']
-        uc_color = hex_to_rgb(str(uc['Color']))
+    uc_indicator_left = uc_left + int(1.7 * INCH)
+    for i, (uc_id, uc_color) in enumerate(map(USECASE_FIELDS, usecases)):
+        uc_color = hex_to_rgb(str(uc_color))
         
-        add_triangle_milestone(slide, uc_indicator_left, legend_top + Inches(0.2 + i * 0.2), 
-                               Inches(0.1), uc_color)
-        add_text_box(slide, uc_indicator_left + Inches(0.12), legend_top + Inches(0.2 + i * 0.2),
-                     Inches(1.2), Inches(0.12), uc_id, font_size=6)
+        add_triangle_milestone(shapes, uc_indicator_left, legend_top + int((0.2 + i * 0.2) * INCH), 
+                               int(0.1 * INCH), uc_color)
+        add_text_box(shapes, uc_indicator_left + int(0.12 * INCH), legend_top + int((0.2 + i * 0.2) * INCH),
+                     int(1.2 * INCH), int(0.12 * INCH), uc_id, font_size=6)
+    
+    add_shapes(slide, shapes)
     
     return prs
 
 
+def presentation_bytes(prs):
+    """Serialize the presentation to .pptx bytes without touching disk."""
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+def save_presentation(prs, output_path):
+    """Save the presentation with a single large write."""
+    data = presentation_bytes(prs)
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python create_roadmap_from_excel.py <excel_file> [output_file]")
@@ -391,7 +619,7 @@ def main():
     print("Creating roadmap...")
     prs = create_roadmap_from_data(data)
     
-    prs.save(output_path)
+    save_presentation(prs, output_path)
     print(f"Roadmap saved to {output_path}")
 
 